@@ -19,6 +19,7 @@ from constants import (
     DEFAULT_LOG_MAX_SIZE_MB, DEFAULT_USE_SLACK, DEFAULT_USE_DISCORD,
     EVENT_TYPE_TV, EVENT_TYPE_MOVIE, VALID_EVENT_TYPES,
     DEFAULT_DISCORD_HIDE_MENTION_INSTRUCTIONS,
+    DEFAULT_DISCORD_PARALLEL_BATCHES,
     DEFAULT_SHOW_TIMEZONE_IN_SUBHEADER,
     DEFAULT_ENABLE_CUSTOM_DISCORD_FOOTER,
     DEFAULT_ENABLE_CUSTOM_SLACK_FOOTER
@@ -217,6 +218,7 @@ class Config:
     # Discord-specific settings
     discord_mention_role_id: Optional[str] = DEFAULT_DISCORD_MENTION_ROLE_ID
     discord_hide_mention_instructions: bool = DEFAULT_DISCORD_HIDE_MENTION_INSTRUCTIONS
+    discord_parallel_batches: bool = DEFAULT_DISCORD_PARALLEL_BATCHES
     
     # Calendar settings
     calendar_urls: List[CalendarUrl] = field(default_factory=list)
@@ -612,12 +614,14 @@ def load_config_from_env() -> Config:
             # --- End Fallback Logic ---
 
             discord_hide_mention_instructions=get_env_bool("DISCORD_HIDE_MENTION_INSTRUCTIONS", DEFAULT_DISCORD_HIDE_MENTION_INSTRUCTIONS)
+            discord_parallel_batches=get_env_bool("DISCORD_PARALLEL_BATCHES", DEFAULT_DISCORD_PARALLEL_BATCHES)
 
             logger.debug(f"📋  Discord enabled: {use_discord}, webhook configured: {'yes' if discord_webhook_url else 'no'}")
             logger.debug(f"📋  Slack enabled: {use_slack}, webhook configured: {'yes' if slack_webhook_url else 'no'}")
             # Update log message to show which variable was used
             logger.debug(f"📋  Discord mention role: {discord_mention_role_id} (Source: {role_id_source})")
             logger.debug(f"📋  Hide Discord mention role message: {discord_hide_mention_instructions}")
+            logger.debug(f"📋  Send Discord batches in parallel: {discord_parallel_batches}")
         except Exception as e:
             logger.error(f"Error loading webhook settings: {e}")
             logger.debug(f"❌  Exception details: {traceback.format_exc()}")
@@ -625,6 +629,7 @@ def load_config_from_env() -> Config:
             slack_webhook_url = None
             discord_mention_role_id = DEFAULT_DISCORD_MENTION_ROLE_ID
             discord_hide_mention_instructions = DEFAULT_DISCORD_HIDE_MENTION_INSTRUCTIONS
+            discord_parallel_batches = DEFAULT_DISCORD_PARALLEL_BATCHES
             use_discord = DEFAULT_USE_DISCORD
             use_slack = DEFAULT_USE_SLACK
 
@@ -696,6 +701,7 @@ def load_config_from_env() -> Config:
                 use_slack=use_slack,
                 discord_mention_role_id=discord_mention_role_id,
                 discord_hide_mention_instructions=discord_hide_mention_instructions,
+                discord_parallel_batches=discord_parallel_batches,
                 custom_header=custom_header,
                 show_date_range=show_date_range,
                 show_timezone_in_subheader=show_timezone_in_subheader,
@@ -3,6 +3,7 @@
 """
 Application-wide constants
 """
+import sys
 
 # ==============================================
 # Calendar & Event Parsing
@@ -17,17 +18,30 @@ MAX_DISCORD_EMBEDS_PER_REQUEST = 10
 DISCORD_SUCCESS_CODES = [200, 204]
 SLACK_SUCCESS_CODES = [200, 201, 204]
 DEFAULT_HTTP_TIMEOUT = 30  # seconds
-DISCORD_EMBED_PAYLOAD_THRESHOLD = 5800
+DISCORD_EMBED_PAYLOAD_THRESHOLD = 5800  # bytes of UTF-8 encoded JSON per embed batch
+DISCORD_MAX_CONCURRENT_BATCHES = 2
+DISCORD_EMBED_DESCRIPTION_LIMIT = 4096  # characters, enforced by Discord per embed
+DISCORD_CONTINUED_TITLE_SUFFIX = " (cont.)"
+HTTP_TOO_MANY_REQUESTS = 429
+WEBHOOK_MAX_RATE_LIMIT_RETRIES = 2
+WEBHOOK_DEFAULT_RETRY_AFTER = 1.0  # seconds, when a 429 carries no usable header
+WEBHOOK_MAX_RETRY_AFTER = 60.0  # seconds; longer waits are treated as a failure
+WEBHOOK_POOL_CONNECTIONS = 4  # distinct webhook hosts kept in the pool
+WEBHOOK_POOL_MAXSIZE = 4  # keep-alive connections kept per host
+WEBHOOK_TRANSIENT_RETRIES = 3  # connection attempts only; a sent POST is never re-sent
+WEBHOOK_RETRY_BACKOFF_FACTOR = 0.3
 
 # ==============================================
 # Common Names
 # ==============================================
 PLATFORM_DISCORD = "discord"
 PLATFORM_SLACK = "slack"
-EVENT_TYPE_TV = "tv"
+# Event types are interned so hot paths can compare them with `is`
+# (Event interns its source_type on creation)
+EVENT_TYPE_TV = sys.intern("tv")
 EVENT_TYPE_ANIME = "anime" # Coming soon (Maybe)
 EVENT_TYPE_ALBUM = "album" # Coming soon (Maybe)
-EVENT_TYPE_MOVIE = "movie"
+EVENT_TYPE_MOVIE = sys.intern("movie")
 VALID_EVENT_TYPES = [EVENT_TYPE_TV, EVENT_TYPE_MOVIE]
 
 # ==============================================
@@ -56,6 +70,10 @@ SLACK_STRIKE_END = "~"
 ITALIC_START = "_"
 ITALIC_END = "_"
 
+# --- Date Formats ---
+DAY_DATE_FORMAT = '%A, %b %d'  # e.g. "Monday, Jan 05": day titles and daily headers
+SHORT_DATE_FORMAT = '%b %d'  # e.g. "Jan 05": weekly header ranges
+
 COLOR_PALETTE = {
     "discord": {
         "red": 15158332,      
@@ -96,6 +114,7 @@ DEFAULT_USE_DISCORD = True
 DEFAULT_USE_SLACK = False
 DEFAULT_DISCORD_MENTION_ROLE_ID = ""
 DEFAULT_DISCORD_HIDE_MENTION_INSTRUCTIONS = False
+DEFAULT_DISCORD_PARALLEL_BATCHES = False
 
 # --- Calendar & Events ---
 DEFAULT_CALENDAR_RANGE = "AUTO"
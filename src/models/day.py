@@ -6,16 +6,30 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime
 
 from models.event_item import EventItem
+from utils.date_utils import get_short_day_name
 
 
-@dataclass
+@dataclass(slots=True)
 class Day:
-    """Represents a day with TV and movie events"""
+    """
+    Represents a day with TV and movie events
+    
+    The event lists are expected to be complete when the Day is created;
+    total_events and short_name are computed once at construction.
+    """
     
     name: str  # something like "Monday, Jan 01"
     tv_events: List[EventItem] = field(default_factory=list)
     movie_events: List[EventItem] = field(default_factory=list)
     date: Optional[datetime] = None  # Full datetime object
+    total_events: int = field(init=False, repr=False, compare=False, default=0)
+    short_name: str = field(init=False, repr=False, compare=False, default="")  # something like "Mon, Jan 01"
+    
+    def __post_init__(self):
+        """Precompute values that are read repeatedly while logging and formatting"""
+        self.total_events = len(self.tv_events) + len(self.movie_events)
+        day_name = self.day_name
+        self.short_name = get_short_day_name(day_name) + self.name[len(day_name):]
     
     @property
     def day_name(self) -> str:
@@ -37,16 +51,6 @@ class Day:
         """
         return bool(self.tv_events or self.movie_events)
     
-    @property
-    def total_events(self) -> int:
-        """
-        Get total number of events
-        
-        Returns:
-            Number of events
-        """
-        return len(self.tv_events) + len(self.movie_events)
-    
     @property
     def premiere_count(self) -> int:
         """
@@ -91,5 +95,6 @@ class Day:
             "time_str": event_item.time_str,
             "show_name": event_item.show_name,
             "episode_number": event_item.episode_number,
-            "episode_title": event_item.episode_title
+            "episode_title": event_item.episode_title,
+            "is_standard_episode": event_item.is_standard_episode
         }
\ No newline at end of file
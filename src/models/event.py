@@ -4,11 +4,12 @@
 from dataclasses import dataclass, field
 from datetime import datetime, date
 import re
+import sys
 import pytz
 from typing import Dict, Any, Tuple
 import icalendar
 
-from constants import PREMIERE_PATTERN, VALID_EVENT_TYPES
+from constants import PREMIERE_PATTERN, VALID_EVENT_TYPES, DAY_DATE_FORMAT
 
 
 @dataclass
@@ -34,6 +35,9 @@ class Event:
         if self.source_type not in VALID_EVENT_TYPES:
             raise ValueError(f"Invalid source_type: {self.source_type}, must be one of {VALID_EVENT_TYPES}")
 
+        # Intern so FormatterService can compare against the constants with `is`
+        self.source_type = sys.intern(self.source_type)
+
     @property
     def is_premiere(self) -> bool:
         """
@@ -59,6 +63,21 @@ class Event:
         # Return True if event is in the past
         return self.start_time < now
     
+    def is_past_at(self, now: datetime) -> bool:
+        """
+        Check if event occurred before a given moment
+        
+        Lets callers checking many events take the current time once
+        instead of once per event.
+        
+        Args:
+            now: Timezone-aware datetime to compare against
+            
+        Returns:
+            Boolean indicating if event is before now
+        """
+        return self.start_time < now
+    
     @property
     def day_key(self) -> str:
         """
@@ -67,7 +86,7 @@ class Event:
         Returns:
             String key in format "Day, Mon DD"
         """
-        return self.start_time.strftime('%A, %b %d')
+        return self.start_time.strftime(DAY_DATE_FORMAT)
     
     def get_event_key(self) -> Tuple[str, date]:
         """
@@ -1,21 +1,27 @@
 #!/usr/bin/env python3
 # src/models/event_item.py
 
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
 from typing import Optional
 
 # Import constants
-from constants import EVENT_TYPE_TV, EVENT_TYPE_MOVIE
+from constants import EVENT_TYPE_TV, EVENT_TYPE_MOVIE, EPISODE_PATTERN
 
+# Regex to identify common SxxExx or NNNxNNN patterns (case-insensitive)
+# Allows S prefix, 1-4 digits for season, E or x separator, 1-4 digits for episode
+EPISODE_REGEX = re.compile(EPISODE_PATTERN, re.IGNORECASE)
 
-@dataclass
+
+@dataclass(slots=True)
 class EventItem:
     """
     Represents a formatted event item ready for display
     
     This class provides a structured representation of an event
     with formatting metadata, allowing platform-specific code to
-    apply the appropriate formatting.
+    apply the appropriate formatting. is_standard_episode is derived
+    from episode_number at construction.
     """
     
     summary: str
@@ -26,6 +32,11 @@ class EventItem:
     show_name: Optional[str] = None
     episode_number: Optional[str] = None
     episode_title: Optional[str] = None
+    is_standard_episode: bool = field(init=False, repr=False, compare=False, default=False)  # episode_number looks like SxxExx / NNxNN
+    
+    def __post_init__(self):
+        """Check the episode number once so every platform can reuse the result"""
+        self.is_standard_episode = bool(self.episode_number and EPISODE_REGEX.match(self.episode_number))
     
     @property
     def has_time(self) -> bool:
@@ -1,12 +1,11 @@
 #!/usr/bin/env python3
 # src/models/platform.py
 
-import re
 from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 import logging
-import traceback
+from concurrent.futures import ThreadPoolExecutor
 from models.day import Day
 from models.event_item import EventItem
 from config.settings import Config
@@ -19,24 +18,88 @@ from constants import (
     NO_CONTENT_TODAY_MSG,
     PLATFORM_DISCORD,
     PLATFORM_SLACK,
-    EPISODE_PATTERN,
+    MAX_DISCORD_EMBEDS_PER_REQUEST,
+    DISCORD_EMBED_PAYLOAD_THRESHOLD,
+    DISCORD_MAX_CONCURRENT_BATCHES,
+    DISCORD_EMBED_DESCRIPTION_LIMIT,
+    DISCORD_CONTINUED_TITLE_SUFFIX,
+    DISCORD_FOOTER_FILE,
+    SLACK_FOOTER_FILE,
     # Import styling constants
     DISCORD_BOLD_START, DISCORD_BOLD_END, DISCORD_ITALIC_START, DISCORD_ITALIC_END, DISCORD_STRIKE_START, DISCORD_STRIKE_END,
     SLACK_BOLD_START, SLACK_BOLD_END, SLACK_ITALIC_START, SLACK_ITALIC_END, SLACK_STRIKE_START, SLACK_STRIKE_END,
     ITALIC_START, ITALIC_END # Universal italic
 )
 from services.webhook_service import WebhookService
-
-# Regex to identify common SxxExx or NNNxNNN patterns (case-insensitive)
-# Allows S prefix, 1-4 digits for season, E or x separator, 1-4 digits for episode
-EPISODE_PATTERN = re.compile(EPISODE_PATTERN, re.IGNORECASE)
+from services.rate_limiter import DiscordRateLimiter
+from utils import json_utils
 
 logger = logging.getLogger("service_platform")
 
+# Bytes contributed by the '{"embeds":[]}' wrapper around a batch of embeds
+EMBEDS_BODY_PREFIX = b'{"embeds":['
+EMBEDS_BODY_SUFFIX = b']}'
+EMBEDS_FRAMING_SIZE = len(EMBEDS_BODY_PREFIX) + len(EMBEDS_BODY_SUFFIX)
+
+
+def _build_embeds_body(embed_jsons: List[bytes]) -> bytes:
+    """
+    Assemble a Discord webhook body from individually serialized embeds
+    
+    Args:
+        embed_jsons: Compact JSON encodings of each embed
+        
+    Returns:
+        The '{"embeds":[...]}' document as bytes
+    """
+    return EMBEDS_BODY_PREFIX + b",".join(embed_jsons) + EMBEDS_BODY_SUFFIX
+
+
+def _plan_batches(sizes: List[int], max_size: int, max_count: int) -> List[List[int]]:
+    """
+    Group consecutive embeds into as few Discord requests as possible
+    
+    Embeds stay in their original (chronological) order. For contiguous
+    groups, filling each batch until the next embed no longer fits already
+    yields the minimum number of requests, so no reordering is needed.
+    An embed that is too large on its own still gets a batch of its own.
+    
+    Args:
+        sizes: Serialized size in bytes of each embed, in day order
+        max_size: Maximum body size of one request, framing included
+        max_count: Maximum number of embeds in one request
+        
+    Returns:
+        List of batches, each a list of indices into sizes
+    """
+    batches: List[List[int]] = []
+    current_batch: List[int] = []
+    current_size = EMBEDS_FRAMING_SIZE
+    
+    for i, size in enumerate(sizes):
+        # A comma separates this embed from the previous one, if any
+        added_size = size + 1 if current_batch else size
+        
+        if current_batch and (len(current_batch) >= max_count or
+                              current_size + added_size > max_size):
+            batches.append(current_batch)
+            current_batch = []
+            current_size = EMBEDS_FRAMING_SIZE
+            added_size = size
+        
+        current_batch.append(i)
+        current_size += added_size
+    
+    if current_batch:
+        batches.append(current_batch)
+    return batches
+
 
 class Platform(ABC):
     """Abstract base class for messaging platforms"""
     
+    DISPLAY_NAME = "Platform" # Human readable name used in log lines
+    
     def __init__(self, webhook_url: str, webhook_service: WebhookService, success_codes: List[int], config: Config  ):
         """
         Initialize platform
@@ -52,6 +115,8 @@ class Platform(ABC):
         self.success_codes = success_codes
         self.config = config
         self.day_colors = self._initialize_day_colors()
+        # Platforms that report rate limits in their responses set this
+        self.rate_limiter: Optional[DiscordRateLimiter] = None
     
     @abstractmethod
     def _initialize_day_colors(self) -> Dict[str, Any]:
@@ -110,9 +175,56 @@ class Platform(ABC):
         return self.webhook_service.send_request(
             self.webhook_url,
             payload,
-            self.success_codes
+            self.success_codes,
+            self.rate_limiter,
+            self.DISPLAY_NAME
         )
     
+    def send_raw(self, body: bytes) -> bool:
+        """
+        Send an already serialized JSON body to platform
+        
+        Args:
+            body: UTF-8 encoded JSON document
+            
+        Returns:
+            Whether message was sent successfully
+        """
+        return self.webhook_service.send_raw(
+            self.webhook_url,
+            body,
+            self.success_codes,
+            self.rate_limiter,
+            self.DISPLAY_NAME
+        )
+
+    @property
+    @abstractmethod
+    def footer_file(self) -> Optional[str]:
+        """
+        Path of the custom footer file for this platform
+        
+        Returns:
+            Footer file path if custom footers are enabled, otherwise None
+        """
+        pass
+
+    @abstractmethod
+    def send_days(self, days: List[Day], header_payload: Dict[str, Any],
+                  footer_content: Optional[str] = None) -> bool:
+        """
+        Send the header, formatted days and optional footer to this platform
+        
+        Args:
+            days: List of Day objects to send
+            header_payload: Payload produced by format_header
+            footer_content: Custom footer text, if any
+            
+        Returns:
+            Whether everything was sent successfully
+        """
+        pass
+    
     @abstractmethod
     def format_tv_event(self, event_item: EventItem, passed_event_handling: str) -> str:
         """
@@ -141,14 +253,48 @@ class Platform(ABC):
         """
         pass
 
+    @staticmethod
+    def _format_episode_details(number: Optional[str], title: Optional[str],
+                                is_standard_ep_num: bool,
+                                italic_start: str, italic_end: str) -> str:
+        """
+        Format the episode number/title part of a TV event
+
+        Standard SxxExx numbers are left plain, anything descriptive
+        (dates, guest names, etc.) is italicized.
+
+        Args:
+            number: Episode number, if parsed
+            title: Episode title, if parsed
+            is_standard_ep_num: Whether number is a standard SxxExx/NNxNN number
+            italic_start: Platform italic opening marker
+            italic_end: Platform italic closing marker
+
+        Returns:
+            Episode details prefixed with " - ", or an empty string
+        """
+        if title:
+            if is_standard_ep_num:
+                return f" - {number} - {italic_start}{title}{italic_end}"
+            return f" - {italic_start}{number} - {title}{italic_end}"
+        if number:
+            if is_standard_ep_num:
+                return f" - {number}"
+            return f" - {italic_start}{number}{italic_end}"
+        return ""
+
 
 class  DiscordPlatform(Platform):
     """Discord implementation of Platform"""
     
+    DISPLAY_NAME = "Discord"
+    
     def __init__(self, webhook_url: str, webhook_service: WebhookService, 
                  success_codes: List[int], config: Config):
         """Initialize with configuration"""
         super().__init__(webhook_url, webhook_service, success_codes, config)
+        # Shared by header, batch and footer sends so they respect one bucket
+        self.rate_limiter = DiscordRateLimiter()
 
         
     def _initialize_day_colors(self) -> Dict[str, int]:
@@ -209,7 +355,7 @@ class  DiscordPlatform(Platform):
 
         except Exception as e:
             logger.error(f"☠️ Error formatting day {day.name} in DiscordPlatform.format_day: {e}")
-            logger.debug(traceback.format_exc())
+            logger.debug("Traceback:", exc_info=True)
             return None # Return None if formatting fails
     
     def format_header(self, custom_header: str, start_date: datetime,
@@ -263,7 +409,7 @@ class  DiscordPlatform(Platform):
 
         except Exception as e:
              logger.error(f"☠️ Error during Discord content assembly in format_header: {e}")
-             logger.debug(traceback.format_exc())
+             logger.debug("Traceback:", exc_info=True)
              # Fallback: Try returning at least the header text if assembly fails
              try:
                  final_content = str(header_text) if header_text is not None else "Error generating message content."
@@ -277,6 +423,189 @@ class  DiscordPlatform(Platform):
             "content": final_content
         }
     
+    @property
+    def footer_file(self) -> Optional[str]:
+        """Discord footer file, if custom Discord footers are enabled"""
+        return DISCORD_FOOTER_FILE if self.config.enable_custom_discord_footer else None
+
+    def send_days(self, days: List[Day], header_payload: Dict[str, Any],
+                  footer_content: Optional[str] = None) -> bool:
+        """
+        Send header, day embeds and footer to Discord.
+        The header goes out on its own, then embeds are batched intelligently
+        based on payload size, then the footer is sent as a separate message.
+
+        Args:
+            days: List of Day objects to send
+            header_payload: Payload produced by format_header
+            footer_content: Custom footer text, if any
+
+        Returns:
+            Whether everything was sent successfully
+        """
+        overall_success = True
+
+        # --- Send Header (Immediately if payload exists) ---
+        if header_payload:
+            logger.info("🚚 Attempting to send Discord header message...")
+            # Log the payload being sent (optional, can be verbose)
+            # logger.debug(f"Header Payload: {header_payload}")
+            header_sent_successfully = self.send_message(header_payload)
+            if not header_sent_successfully:
+                logger.error("❌ Failed to send Discord header message. Aborting further sends for Discord.")
+                return False # Stop processing for this platform if header fails
+            else:
+                # Explicitly log success AFTER the send call returns
+                logger.info("✅ Discord header message acknowledged by webhook service.")
+        else:
+            logger.warning("⚠️ No header payload generated for Discord.")
+
+        # --- Format and Send Days (Embeds) ---
+        # With nothing scheduled there is nothing to format or batch
+        if days and not self._send_embeds(days):
+            overall_success = False
+
+        # --- Send Discord Footer Separately (ALWAYS if content exists) ---
+        if footer_content:
+            logger.info("🚚  Sending custom Discord footer as separate message...")
+            if not self.send_message({"content": footer_content}):
+                overall_success = False
+                logger.error("Failed to send Discord footer message.")
+        # --- End Discord Footer ---
+
+        return overall_success
+
+    def _send_embeds(self, days: List[Day]) -> bool:
+        """
+        Format days as embeds and send them in size-limited batches.
+
+        Args:
+            days: List of Day objects to send
+
+        Returns:
+            Whether every day was formatted and sent successfully
+        """
+        overall_success = True
+
+        # --- Format Days (Embeds) ---
+        logger.info("Formatting %s days for Discord...", len(days))
+        # Every embed is serialized exactly once; batch sizes are then tracked
+        # from these lengths instead of re-encoding whole batches
+        embed_jsons = []
+        max_embed_bytes = DISCORD_EMBED_PAYLOAD_THRESHOLD - EMBEDS_FRAMING_SIZE
+        for day in days:
+            try:
+
+                embed = self.format_day(day)
+                if embed: # Only add if embed was successfully created
+                    embed_json = json_utils.dumps(embed)
+                    if (len(embed_json) > max_embed_bytes or
+                            len(embed["description"]) > DISCORD_EMBED_DESCRIPTION_LIMIT):
+                        # Too big to ever be accepted, split it up front instead of failing at send time
+                        parts = self._split_embed(embed, max_embed_bytes)
+                        logger.info("✂️  Splitting %s into %d embeds to fit Discord's limits", day.name, len(parts))
+                        embed_jsons.extend(json_utils.dumps(part) for part in parts)
+                    else:
+                        embed_jsons.append(embed_json)
+                else:
+                    logger.warning("Skipping day %s due to formatting error (no embed generated).", day.name)
+            except Exception as e:
+                 logger.error("☠️  Error formatting day %s for Discord: %s", day.name, e)
+                 logger.debug("Traceback:", exc_info=True)
+                 overall_success = False # Mark failure but continue formatting
+
+        # --- Send Batched Embeds ---
+        logger.info("🚚 Sending %s formatted day embeds to Discord using smart batching...", len(embed_jsons))
+
+        batch_plan = _plan_batches(
+            [len(embed_json) for embed_json in embed_jsons],
+            DISCORD_EMBED_PAYLOAD_THRESHOLD,
+            MAX_DISCORD_EMBEDS_PER_REQUEST
+        )
+        # Batches are planned first, then sent
+        batch_payloads = [_build_embeds_body([embed_jsons[i] for i in batch]) for batch in batch_plan]
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Planned %s Discord batches, sizes: %s", len(batch_payloads), [len(body) for body in batch_payloads])
+
+        if not self._send_batches(batch_payloads):
+            overall_success = False
+
+        return overall_success
+
+    @staticmethod
+    def _split_embed(embed: Dict[str, Any], max_bytes: int) -> List[Dict[str, Any]]:
+        """
+        Split an embed's description on line boundaries.
+        Every part stays within max_bytes when serialized and within
+        Discord's description length limit. Parts after the first get a
+        "(cont.)" title.
+
+        Args:
+            embed: Embed produced by format_day
+            max_bytes: Maximum serialized size of a single embed
+
+        Returns:
+            List of embeds in display order
+        """
+        title = embed["title"]
+        cont_title = f"{title}{DISCORD_CONTINUED_TITLE_SUFFIX}"
+        # Bytes taken by everything except the description's content
+        overhead = len(json_utils.dumps({**embed, "title": cont_title, "description": ""}))
+        budget = max_bytes - overhead
+
+        chunks: List[List[str]] = []
+        current: List[str] = []
+        current_bytes = 0
+        current_chars = 0
+        for line in embed["description"].split("\n"):
+            if not current and not line:
+                continue # Don't start a part with the blank line between TV and movies
+            # JSON-escaped size of the line, plus the escaped newline joining it
+            line_bytes = len(json_utils.dumps(line)) - 2
+            sep_bytes, sep_chars = (2, 1) if current else (0, 0)
+            if current and (current_bytes + sep_bytes + line_bytes > budget or
+                            current_chars + sep_chars + len(line) > DISCORD_EMBED_DESCRIPTION_LIMIT):
+                chunks.append(current)
+                current, current_bytes, current_chars = [], 0, 0
+                sep_bytes, sep_chars = 0, 0
+            current.append(line)
+            current_bytes += sep_bytes + line_bytes
+            current_chars += sep_chars + len(line)
+        if current:
+            chunks.append(current)
+
+        return [
+            {**embed, "title": title if i == 0 else cont_title, "description": "\n".join(lines)}
+            for i, lines in enumerate(chunks)
+        ]
+
+    def _send_batches(self, batch_payloads: List[bytes]) -> bool:
+        """
+        Send planned embed batches to Discord.
+        Batches go out in order by default. With DISCORD_PARALLEL_BATCHES
+        enabled they are posted concurrently (bounded by
+        DISCORD_MAX_CONCURRENT_BATCHES), which is faster but lets Discord
+        display the days out of order.
+
+        Args:
+            batch_payloads: Serialized embed batch bodies, in day order
+
+        Returns:
+            Whether every batch was sent successfully
+        """
+        if self.config.discord_parallel_batches and len(batch_payloads) > 1:
+            max_workers = min(DISCORD_MAX_CONCURRENT_BATCHES, len(batch_payloads))
+            logger.debug("Sending %s Discord batches with %s workers", len(batch_payloads), max_workers)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                batch_results = list(executor.map(self.send_raw, batch_payloads))
+        else:
+            batch_results = [self.send_raw(body) for body in batch_payloads]
+
+        for sent in batch_results:
+            if not sent:
+                logger.error("Failed to send a Discord batch.")
+        return all(batch_results)
+
     def format_tv_event(self, event_item: EventItem, passed_event_handling: str) -> str:
         """
         Format a TV event
@@ -286,32 +615,16 @@ class  DiscordPlatform(Platform):
             passed_event_handling: How to handle passed events (DISPLAY, HIDE, STRIKE)
         """
         time_prefix = f"{event_item.time_str}: " if event_item.time_str else ""
+        premiere_suffix = "  🎉" if event_item.is_premiere else ""
         show_name_to_format = event_item.show_name if event_item.show_name else event_item.summary
+        episode_details = self._format_episode_details(
+            event_item.episode_number, event_item.episode_title,
+            event_item.is_standard_episode,
+            DISCORD_ITALIC_START, DISCORD_ITALIC_END
+        )
 
-        formatted_show = f"{DISCORD_BOLD_START}{show_name_to_format}{DISCORD_BOLD_END}"
-
-        episode_details = ""
-        number = event_item.episode_number
-        title = event_item.episode_title
-
-        if title:
-            is_standard_ep_num = bool(number and EPISODE_PATTERN.match(number))
-            if is_standard_ep_num:
-                episode_details = f" - {number} - {DISCORD_ITALIC_START}{title}{DISCORD_ITALIC_END}"
-            else:
-                episode_details = f" - {DISCORD_ITALIC_START}{number} - {title}{DISCORD_ITALIC_END}"
-        elif number:
-            is_standard_ep_num = bool(EPISODE_PATTERN.match(number))
-            if is_standard_ep_num:
-                # Standard number only: Show - SxxExx
-                episode_details = f" - {number}"
-            else:
-                # Non-standard number only: Show - *Number*
-                episode_details = f" - {DISCORD_ITALIC_START}{number}{DISCORD_ITALIC_END}"
-
-        formatted = f"{time_prefix}{formatted_show}{episode_details}"
-        if event_item.is_premiere:
-            formatted += "  🎉"
+        formatted = (f"{time_prefix}{DISCORD_BOLD_START}{show_name_to_format}{DISCORD_BOLD_END}"
+                     f"{episode_details}{premiere_suffix}")
         if event_item.is_past and passed_event_handling == "STRIKE":
             formatted = f"{DISCORD_STRIKE_START}{formatted}{DISCORD_STRIKE_END}"
 
@@ -332,6 +645,8 @@ class  DiscordPlatform(Platform):
 class SlackPlatform(Platform):
     """Slack implementation of Platform"""
     
+    DISPLAY_NAME = "Slack"
+    
     def __init__(self, webhook_url: str, webhook_service: WebhookService, 
                  success_codes: List[int], config: Config):
         """Initialize with configuration"""
@@ -462,34 +777,118 @@ class SlackPlatform(Platform):
             "blocks": blocks
         }
 
+    @property
+    def footer_file(self) -> Optional[str]:
+        """Slack footer file, if custom Slack footers are enabled"""
+        return SLACK_FOOTER_FILE if self.config.enable_custom_slack_footer else None
+
+    def send_days(self, days: List[Day], header_payload: Dict[str, Any],
+                  footer_content: Optional[str] = None) -> bool:
+        """
+        Send header blocks and all days as attachments in a single Slack
+        message, then the footer as a separate message.
+
+        Args:
+            days: List of Day objects to send
+            header_payload: Payload produced by format_header
+            footer_content: Custom footer text, if any
+
+        Returns:
+            Whether everything was sent successfully
+        """
+        overall_success = True
+
+        # --- Format Days (Attachments) ---
+        logger.info("Formatting %s days for Slack...", len(days))
+        attachments = []
+        for day in days:
+             try:
+                 attachment = self.format_day(day)
+                 if attachment:
+                     attachments.append(attachment)
+                 else:
+                     logger.warning("Skipping day %s due to formatting error (no attachment generated).", day.name)
+             except Exception as e:
+                 logger.error("☠️  Error formatting day %s for Slack: %s", day.name, e)
+                 logger.debug("Traceback:", exc_info=True)
+                 overall_success = False
+
+        # --- Construct Slack Payload (Header Blocks + Day Attachments ONLY) ---
+        slack_payload = {}
+        # We only need header blocks here now
+        header_blocks = []
+        if header_payload and "blocks" in header_payload and header_payload["blocks"]:
+            header_blocks.extend(header_payload["blocks"])
+            logger.debug("🧱  Using %s header blocks.", len(header_blocks))
+        else:
+            logger.warning("⚠️  Header payload missing or 'blocks' key is empty/missing.")
+
+        # Add header blocks to payload if they exist
+        if header_blocks:
+            slack_payload["blocks"] = header_blocks
+
+        # Add attachments if they exist
+        if attachments:
+            slack_payload["attachments"] = attachments
+            logger.debug("Added %s attachments.", len(attachments))
+        else:
+            logger.warning("⚠️  No attachments generated for Slack message.")
+
+        # --- Send the Main Slack Message (Header + Attachments) ---
+        if slack_payload: # Check if payload has blocks or attachments
+            if logger.isEnabledFor(logging.DEBUG): # Pretty-printing the payload isn't free
+                logger.debug("Main Slack Payload (Header + Attachments): %s", json_utils.dumps_pretty(slack_payload))
+            logger.info("🚚 Sending main Slack message with %s blocks and %s attachments...", len(header_blocks), len(attachments))
+            if not self.send_message(slack_payload):
+                overall_success = False
+                logger.error("Failed to send main Slack message.")
+            else:
+                logger.info("✅  Main Slack message acknowledged.")
+        else:
+             logger.error("❌  Main Slack payload was empty (no blocks or attachments), skipping send.")
+
+        # Send the footer as a separate message containing the context block
+        if footer_content:
+            logger.info("🚚  Sending custom Slack footer as separate context block...")
+            footer_payload = {
+                "blocks": [
+                    {
+                        "type": "text",
+                        "elements": [
+                            {
+                                "type": "mrkdwn",
+                                "text": footer_content
+                            }
+                        ]
+                    }
+                ]
+            }
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Slack Footer Payload: %s", json_utils.dumps_pretty(footer_payload))
+            if not self.send_message(footer_payload):
+                overall_success = False
+                logger.error("Failed to send Slack footer message.")
+            else:
+                logger.info("✅  Slack footer message acknowledged.")
+        # --- END Separate Footer Sending ---
+
+        return overall_success
+
     def format_tv_event(self, event_item: EventItem, passed_event_handling: str) -> str:
         """
         Format a TV event for Slack, applying italics based on content.
         """
         time_prefix = f"{event_item.time_str}: " if event_item.time_str else ""
+        premiere_suffix = "  " if event_item.is_premiere else ""
         show_name_to_format = event_item.show_name if event_item.show_name else event_item.summary
-        formatted_show = f"{SLACK_BOLD_START}{show_name_to_format}{SLACK_BOLD_END}"
-
-        episode_details = ""
-        number = event_item.episode_number
-        title = event_item.episode_title
-
-        if title:
-            is_standard_ep_num = bool(number and EPISODE_PATTERN.match(number))
-            if is_standard_ep_num:
-                episode_details = f" - {number} - {SLACK_ITALIC_START}{title}{SLACK_ITALIC_END}"
-            else:
-                episode_details = f" - {SLACK_ITALIC_START}{number} - {title}{SLACK_ITALIC_END}"
-        elif number:
-            is_standard_ep_num = bool(EPISODE_PATTERN.match(number))
-            if is_standard_ep_num:
-                episode_details = f" - {number}"
-            else:
-                episode_details = f" - {SLACK_ITALIC_START}{number}{SLACK_ITALIC_END}"
+        episode_details = self._format_episode_details(
+            event_item.episode_number, event_item.episode_title,
+            event_item.is_standard_episode,
+            SLACK_ITALIC_START, SLACK_ITALIC_END
+        )
 
-        formatted = f"{time_prefix}{formatted_show}{episode_details}"
-        if event_item.is_premiere:
-            formatted += "  "
+        formatted = (f"{time_prefix}{SLACK_BOLD_START}{show_name_to_format}{SLACK_BOLD_END}"
+                     f"{episode_details}{premiere_suffix}")
         if event_item.is_past and passed_event_handling == "STRIKE":
             formatted = f"{SLACK_STRIKE_START}{formatted}{SLACK_STRIKE_END}"
 
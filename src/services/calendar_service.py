@@ -6,6 +6,7 @@ import requests
 import icalendar
 import recurring_ical_events
 from datetime import datetime
+from operator import attrgetter
 from typing import List
 
 from models.event import Event
@@ -47,7 +48,7 @@ class CalendarService:
                 logger.error(f"Error fetching from calendar {url_info.url}: {str(e)}")
         
         # Sort events by start time
-        all_events.sort(key=lambda e: e.start_time)
+        all_events.sort(key=attrgetter('start_time'))
         
         return all_events
     
@@ -83,7 +84,7 @@ class CalendarService:
             # Get recurring events
             ical_events = recurring_ical_events.of(calendar).between(start_date, end_date)
             
-            logger.debug(f"🔎 Found {len(list(ical_events))} raw events in calendar from {url}")
+            logger.debug("🔎 Found %d raw events in calendar from %s", len(ical_events), url)
             
             # Process events
             processed_events = []
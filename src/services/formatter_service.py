@@ -2,20 +2,54 @@
 # src/services/formatter_service.py
 
 import logging
-import re
-from typing import Dict, List, Tuple
-from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime, date
 from collections import defaultdict
+import pytz
 
 from models.day import Day
 from models.event import Event
 from models.event_item import EventItem
 from config.settings import Config
-from utils.date_utils import get_days_order, get_short_day_name, parse_event_datetime, format_time
-from constants import EVENT_TYPE_TV, EVENT_TYPE_MOVIE
+from utils.date_utils import get_days_order, parse_event_datetime, format_time
+from constants import EVENT_TYPE_TV, EVENT_TYPE_MOVIE, DAY_DATE_FORMAT
 
 logger = logging.getLogger("formatter_service")
 
+TV_SUMMARY_SEPARATOR = " - "
+
+
+def _parse_tv_summary(summary: str) -> Tuple[str, Optional[str], Optional[str]]:
+    """
+    Split a Sonarr summary like "Show - S01E02 - Title" into its parts
+    
+    Whitespace runs (tabs, non-breaking spaces, repeated spaces) are
+    collapsed to single spaces first, so any whitespace around the dash
+    counts as a separator, and the split itself is a plain str.find on
+    " - " instead of a regex.
+    
+    Args:
+        summary: Event summary
+        
+    Returns:
+        Tuple of (show_name, episode_number, episode_title); missing parts are None
+    """
+    normalized = " ".join(summary.split())
+    sep_len = len(TV_SUMMARY_SEPARATOR)
+    
+    i = normalized.find(TV_SUMMARY_SEPARATOR)
+    if i < 0:
+        return summary, None, None
+    
+    show_name = normalized[:i]
+    episode_info = normalized[i + sep_len:]
+    
+    j = episode_info.find(TV_SUMMARY_SEPARATOR)
+    if j < 0:
+        return show_name, episode_info, None
+    
+    return show_name, episode_info[:j], episode_info[j + sep_len:]
+
 
 class FormatterService:
     """Service for formatting calendar events into platform-specific formats"""
@@ -47,8 +81,8 @@ class FormatterService:
             return [], {"tv_count": 0, "movie_count": 0, "premiere_count": 0}
         
         # Count events by type
-        tv_count = sum(1 for e in events if e.source_type == EVENT_TYPE_TV)
-        movie_count = sum(1 for e in events if e.source_type == EVENT_TYPE_MOVIE)
+        tv_count = sum(1 for e in events if e.source_type is EVENT_TYPE_TV)
+        movie_count = sum(1 for e in events if e.source_type is EVENT_TYPE_MOVIE)
         
         logger.debug(f"🔢 Processing {tv_count} TV episodes and {movie_count} movies for display")
         
@@ -57,20 +91,27 @@ class FormatterService:
         events = self._deduplicate_events(events)
         deduplicated_count = original_event_count - len(events)
         
-        # Group events by day and type
-        days_data = defaultdict(lambda: {EVENT_TYPE_TV: [], EVENT_TYPE_MOVIE: []})
+        # Group events by day, with one bucket per type
+        tv_buckets: Dict[date, List[EventItem]] = defaultdict(list)
+        movie_buckets: Dict[date, List[EventItem]] = defaultdict(list)
         premiere_count = 0
         skipped_past_count = 0
+        hide_past = self.config.passed_event_handling == "HIDE"
+        now = datetime.now(pytz.UTC) # Aware datetimes compare correctly across timezones
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         
         for event in events:
+            is_past = event.is_past_at(now)
+            
             # Skip past events if configured to hide them
-            if event.is_past and self.config.passed_event_handling == "HIDE":
-                logger.debug(f"⏪  Skipping past event: {event.summary}")
+            if hide_past and is_past:
+                if debug_enabled:
+                    logger.debug("⏪  Skipping past event: %s", event.summary)
                 skipped_past_count += 1
                 continue
             
             # Create EventItem from Event
-            event_item = self._create_event_item(event)
+            event_item = self._create_event_item(event, is_past)
             
             # Count premieres
             if event_item.is_premiere:
@@ -78,23 +119,26 @@ class FormatterService:
             
             # Add to the appropriate day and type
             event_date = event.start_time.date()
-            days_data[event_date][event_item.source_type].append(event_item)
+            if event_item.source_type is EVENT_TYPE_TV:
+                tv_buckets[event_date].append(event_item)
+            else:
+                movie_buckets[event_date].append(event_item)
         
         # Create Day objects
         days = []
-        for date_obj, content in sorted(days_data.items()): # Use date_obj to avoid confusion
-            day_name_str = date_obj.strftime('%A, %b %d') # Format the name string
+        for date_obj in sorted(tv_buckets.keys() | movie_buckets.keys()): # Use date_obj to avoid confusion
+            day_name_str = date_obj.strftime(DAY_DATE_FORMAT) # Format the name string
             day = Day(
                 name=day_name_str, # Pass the formatted name
                 date=date_obj, # Pass the original date object
-                tv_events=content[EVENT_TYPE_TV],
-                movie_events=content[EVENT_TYPE_MOVIE]
+                tv_events=tv_buckets.get(date_obj, []),
+                movie_events=movie_buckets.get(date_obj, [])
             )
             days.append(day)
         
         logger.info(f"📊 Total days processed: {len(days)}")
         for day in days:
-            logger.info(f"    ├ {get_short_day_name(day.name)}: {day.total_events} events")
+            logger.info("    ├ %s: %d events", day.short_name, day.total_events)
         
         stats = {
             "total_tv": tv_count,
@@ -149,12 +193,13 @@ class FormatterService:
             
         return list(unique_events.values())
     
-    def _create_event_item(self, event: Event) -> EventItem:
+    def _create_event_item(self, event: Event, is_past: bool) -> EventItem:
         """
         Create an EventItem from an Event
         
         Args:
             event: Event to process
+            is_past: Whether the event has already occurred
             
         Returns:
             EventItem instance
@@ -168,12 +213,11 @@ class FormatterService:
         use_24_hour = self.config.time_settings.use_24_hour
         add_leading_zero = self.config.time_settings.add_leading_zero
         
-        # Parse datetime components
-        dt_parts = parse_event_datetime(start, self.config.timezone)
-        
-        # Format time string if display_time is enabled
+        # Format time string if display_time is enabled. Movies never display
+        # a release time, so skip parsing the datetime for them entirely
         time_str = None
-        if display_time:
+        if display_time and event.source_type is EVENT_TYPE_TV:
+            dt_parts = parse_event_datetime(start, self.config.timezone)
             time_str = format_time(
                 dt_parts["hour"], 
                 dt_parts["minute"], 
@@ -187,25 +231,15 @@ class FormatterService:
         episode_title = None
         
         # For TV shows, try to parse show, episode number, and title
-        if event.source_type == EVENT_TYPE_TV:
-            parts = re.split(r'\s+-\s+', summary, 1)
-            if len(parts) == 2:
-                show_name = parts[0]
-                episode_info = parts[1]
-                
-                # Split again by ' - ' to separate episode number from title
-                sub_parts = re.split(r'\s+-\s+', episode_info, 1)
-                if len(sub_parts) == 2:
-                    episode_number, episode_title = sub_parts
-                else:
-                    episode_number = episode_info
+        if event.source_type is EVENT_TYPE_TV:
+            show_name, episode_number, episode_title = _parse_tv_summary(summary)
         
         # Create the EventItem
         return EventItem(
             summary=summary,
             source_type=event.source_type,
             is_premiere=is_premiere,
-            is_past=event.is_past,
+            is_past=is_past,
             time_str=time_str,
             show_name=show_name,
             episode_number=episode_number,
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# src/services/rate_limiter.py
+
+import logging
+import threading
+import time
+from typing import Mapping, Optional
+
+logger = logging.getLogger("rate_limiter")
+
+
+class DiscordRateLimiter:
+    """
+    Client-side view of a Discord webhook's rate limit bucket
+
+    Discord reports how many requests are left in the current bucket
+    (X-RateLimit-Remaining) and how long until it refills
+    (X-RateLimit-Reset-After). Sends go out back-to-back while the bucket
+    has capacity and only wait once it is known to be empty.
+    """
+
+    def __init__(self):
+        """Initialize with an unknown bucket; nothing blocks until Discord reports one"""
+        self._lock = threading.Lock()
+        self._remaining: Optional[int] = None
+        self._reset_at = 0.0
+
+    def acquire(self) -> None:
+        """
+        Take one request from the bucket, waiting for a refill if it is empty
+
+        The lock is held while waiting so concurrent senders queue up behind
+        the refill instead of all firing at once when it happens.
+        """
+        with self._lock:
+            if self._remaining is not None and self._remaining <= 0:
+                wait = self._reset_at - time.monotonic()
+                if wait > 0:
+                    logger.debug("⏳  Discord rate limit bucket empty, waiting %.2fs", wait)
+                    time.sleep(wait)
+                # The bucket has refilled, but its size is only known after the next response
+                self._remaining = None
+
+            if self._remaining is not None:
+                self._remaining -= 1
+
+    def update_from_response(self, headers: Mapping[str, str]) -> None:
+        """
+        Refresh the bucket state from a webhook response
+
+        Args:
+            headers: Response headers; ignored if they carry no rate limit info
+        """
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset_after = headers.get('X-RateLimit-Reset-After')
+        if remaining is None or reset_after is None:
+            return
+
+        try:
+            remaining_count = int(remaining)
+            reset_at = time.monotonic() + float(reset_after)
+        except ValueError:
+            logger.debug("Ignoring malformed rate limit headers: %s / %s", remaining, reset_after)
+            return
+
+        with self._lock:
+            self._remaining = remaining_count
+            self._reset_at = reset_at
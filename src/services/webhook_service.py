@@ -2,12 +2,41 @@
 # src/services/webhook_service.py
 
 import logging
+import time
 import requests
-from typing import Dict, List, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, List, Any, Optional
+
+from utils import json_utils
+from services.rate_limiter import DiscordRateLimiter
+from constants import (
+    HTTP_TOO_MANY_REQUESTS,
+    WEBHOOK_MAX_RATE_LIMIT_RETRIES,
+    WEBHOOK_DEFAULT_RETRY_AFTER,
+    WEBHOOK_MAX_RETRY_AFTER,
+    WEBHOOK_POOL_CONNECTIONS,
+    WEBHOOK_POOL_MAXSIZE,
+    WEBHOOK_TRANSIENT_RETRIES,
+    WEBHOOK_RETRY_BACKOFF_FACTOR
+)
 
 logger = logging.getLogger("webhook_service")
 
 
+def _log_tag(label: Optional[str]) -> str:
+    """
+    Build the prefix used to tag log lines for a sender
+    
+    Args:
+        label: Sender name, if any
+        
+    Returns:
+        "[label] " or an empty string
+    """
+    return f"[{label}] " if label else ""
+
+
 class WebhookService:
     """Service for sending data to webhooks"""
     
@@ -19,9 +48,56 @@ class WebhookService:
             http_timeout: HTTP request timeout in seconds
         """
         self.http_timeout = http_timeout
+        # One session for every webhook call so connections (and TLS) are reused
+        self._session = self._create_session()
+    
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """
+        Build the pooled HTTP session shared by all platforms
+        
+        Only failures to connect are retried (with backoff) by urllib3. Webhook
+        POSTs are not idempotent, so once a request may have reached the server
+        (read errors, timeouts, 5xx responses) it is never re-sent, or the same
+        message could be posted twice. 429s are left to send_raw so the
+        webhook's Retry-After is honored there.
+        
+        Returns:
+            Configured requests Session
+        """
+        retries = Retry(
+            total=WEBHOOK_TRANSIENT_RETRIES,
+            connect=WEBHOOK_TRANSIENT_RETRIES,
+            read=0,
+            status=0,
+            other=0,
+            backoff_factor=WEBHOOK_RETRY_BACKOFF_FACTOR,
+            respect_retry_after_header=False, # 429s are handled by send_raw
+            raise_on_status=False # Hand the final response back so it gets logged
+        )
+        adapter = HTTPAdapter(
+            pool_connections=WEBHOOK_POOL_CONNECTIONS,
+            pool_maxsize=WEBHOOK_POOL_MAXSIZE,
+            max_retries=retries
+        )
+        session = requests.Session()
+        # Every webhook body is JSON; set the headers once instead of per request
+        session.headers.update({
+            'Content-Type': 'application/json',
+            'Connection': 'keep-alive'
+        })
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+    
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections"""
+        self._session.close()
     
     def send_request(self, webhook_url: str, payload: Dict[str, Any], 
-                   success_codes: List[int]) -> bool:
+                   success_codes: List[int],
+                   rate_limiter: Optional[DiscordRateLimiter] = None,
+                   label: Optional[str] = None) -> bool:
         """
         Send data to a webhook and check for success
         
@@ -29,31 +105,101 @@ class WebhookService:
             webhook_url: URL to send data to
             payload: Data to send
             success_codes: HTTP status codes that indicate success
+            rate_limiter: Rate limit bucket to wait on and update, if any
+            label: Name to tag log lines with, e.g. the platform name
             
         Returns:
             Boolean indicating success
         """
-        headers = {'Content-Type': 'application/json'}
+        try:
+            body = json_utils.dumps(payload)
+        except json_utils.JSONEncodeError as e:
+            logger.error("%sError serializing webhook payload: %s", _log_tag(label), e)
+            return False
+        
+        return self.send_raw(webhook_url, body, success_codes, rate_limiter, label)
+    
+    def send_raw(self, webhook_url: str, body: bytes, 
+               success_codes: List[int],
+               rate_limiter: Optional[DiscordRateLimiter] = None,
+               label: Optional[str] = None) -> bool:
+        """
+        Send an already serialized JSON body to a webhook and check for success
         
+        Args:
+            webhook_url: URL to send data to
+            body: UTF-8 encoded JSON document
+            success_codes: HTTP status codes that indicate success
+            rate_limiter: Rate limit bucket to wait on and update, if any
+            label: Name to tag log lines with, e.g. the platform name
+            
+        Returns:
+            Boolean indicating success
+        """
+        # Platforms send concurrently, so tag lines to keep interleaved output readable
+        tag = _log_tag(label)
         try:
-            response = requests.post(
-                webhook_url, 
-                json=payload, 
-                headers=headers, 
-                timeout=self.http_timeout
-            )
-            logger.debug(f"Webhook URL: {webhook_url}")
+            for attempt in range(WEBHOOK_MAX_RATE_LIMIT_RETRIES + 1):
+                if rate_limiter:
+                    rate_limiter.acquire()
+                response = self._session.post(
+                    webhook_url, 
+                    data=body, 
+                    timeout=self.http_timeout
+                )
+                if rate_limiter:
+                    rate_limiter.update_from_response(response.headers)
+                if response.status_code != HTTP_TOO_MANY_REQUESTS or attempt == WEBHOOK_MAX_RATE_LIMIT_RETRIES:
+                    break
+                
+                # Rate limited: wait as instructed, blocking only this sender's thread
+                retry_after = self._get_retry_after(response)
+                if retry_after is None:
+                    logger.error("%s❌  Webhook rate limit wait is too long, giving up", tag)
+                    break
+                logger.warning("%s⏳  Webhook rate limited, retrying in %.2fs", tag, retry_after)
+                time.sleep(retry_after)
+            
+            logger.debug("%sWebhook URL: %s", tag, webhook_url)
             is_success = response.status_code in success_codes
             emoji = "✅" if is_success else "❌"
 
-            logger.info(f"{emoji}  Webhook response status code: {response.status_code}")
+            logger.info("%s%s  Webhook response status code: %s", tag, emoji, response.status_code)
             
             if is_success:
                 return True
             else:
-                logger.error(f"❌  Failed to send webhook: {response.text}")
+                logger.error("%s❌  Failed to send webhook: %s", tag, response.text)
                 return False
                 
         except requests.RequestException as e:
-            logger.error(f"Error sending to webhook: {str(e)}")
-            return False
\ No newline at end of file
+            logger.error("%sError sending to webhook: %s", tag, e)
+            return False
+    
+    @staticmethod
+    def _get_retry_after(response: requests.Response) -> Optional[float]:
+        """
+        Work out how long to wait after a 429 response
+        
+        Args:
+            response: Rate limited response
+            
+        Returns:
+            Seconds to wait, or None if the wait is too long to be worth retrying
+        """
+        retry_after = WEBHOOK_DEFAULT_RETRY_AFTER
+        # Discord also sends X-RateLimit-Reset-After with sub-second precision
+        for header in ('Retry-After', 'X-RateLimit-Reset-After'):
+            value = response.headers.get(header)
+            if value is None:
+                continue
+            try:
+                retry_after = max(0.0, float(value))
+                break
+            except ValueError:
+                continue
+        
+        if retry_after > WEBHOOK_MAX_RETRY_AFTER:
+            logger.debug("Webhook asked to retry after %.0fs", retry_after)
+            return None
+        return retry_after
@@ -3,12 +3,65 @@
 
 import pytz
 import datetime
+from functools import lru_cache
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 from typing import Dict, List, Tuple
 import logging
 
+from constants import DAY_DATE_FORMAT, SHORT_DATE_FORMAT
+
 logger = logging.getLogger("utils_date")
 
 
+@lru_cache(maxsize=32)
+def _tz(timezone_str: str) -> datetime.tzinfo:
+    """
+    Look up a timezone, caching the result
+    
+    Args:
+        timezone_str: IANA timezone name
+        
+    Returns:
+        pytz timezone, or UTC if the name is unknown
+    """
+    try:
+        return pytz.timezone(timezone_str)
+    except pytz.exceptions.UnknownTimeZoneError:
+        # Only logged once per name thanks to the cache
+        logger.warning(f"❌  Unknown timezone: {timezone_str}, falling back to UTC")
+        return pytz.UTC
+
+
+@lru_cache(maxsize=32)
+def _zi(timezone_str: str) -> datetime.tzinfo:
+    """
+    Look up a zoneinfo timezone, caching the result
+    
+    zoneinfo zones work with plain astimezone()/replace(tzinfo=...)
+    and are faster to convert with than pytz, so per-event parsing uses them.
+    
+    Args:
+        timezone_str: IANA timezone name
+        
+    Returns:
+        ZoneInfo timezone, or UTC if the name is unknown
+    """
+    try:
+        return ZoneInfo(timezone_str)
+    except (ZoneInfoNotFoundError, ValueError):
+        logger.warning(f"❌  Unknown timezone: {timezone_str}, falling back to UTC")
+        return datetime.timezone.utc
+
+
+# Days since the start of a Sunday-first week, indexed by Python weekday (0=Monday)
+_SUN_START_ADJUST = (1, 2, 3, 4, 5, 6, 0)
+
+# English names, matching strftime("%b") / strftime("%A") under the C locale
+_MONTH_ABBR = ("", "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+               "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+_WEEKDAY_NAME = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+
 def calculate_date_range(calendar_range: str, start_week_on_monday: bool, timezone_str: str = "UTC"):
     """
     Calculate start and end dates based on the calendar range setting.
@@ -21,43 +74,34 @@ def calculate_date_range(calendar_range: str, start_week_on_monday: bool, timezo
     Returns:
         Tuple of (start_date, end_date) as datetime objects
     """
-    import datetime
-    import pytz
-    
     logger = logging.getLogger("calendar")
-    logger.debug(f"🔍  Calculating date range with: range={calendar_range}, start_on_monday={start_week_on_monday}, tz={timezone_str}")
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    if debug_enabled:
+        logger.debug(f"🔍  Calculating date range with: range={calendar_range}, start_on_monday={start_week_on_monday}, tz={timezone_str}")
     
-    try:
-        timezone = pytz.timezone(timezone_str)
-    except pytz.exceptions.UnknownTimeZoneError:
-        logger.warning(f"❌  Unknown timezone: {timezone_str}, falling back to UTC")
-        timezone = pytz.UTC
+    timezone = _tz(timezone_str)
     
     # Get current date in the specified timezone
     now = datetime.datetime.now(timezone)
     today = now.replace(hour=0, minute=0, second=0, microsecond=0)
-    logger.debug(f"📅  Current date in {timezone_str}: {today}")
+    if debug_enabled:
+        logger.debug(f"📅  Current date in {timezone_str}: {today}")
     
     # For "DAY" mode, simply use today
     if calendar_range == "DAY":
-        logger.debug(f"📅  Using DAY mode: {today} to {today + datetime.timedelta(days=1)}")
+        if debug_enabled:
+            logger.debug(f"📅  Using DAY mode: {today} to {today + datetime.timedelta(days=1)}")
         return today, today + datetime.timedelta(days=1)
     
     # For "WEEK" mode, calculate start and end of the current week
     # Get the current weekday (0=Monday in Python's datetime by default)
     weekday = today.weekday()
     
-    # Adjust for Sunday as first day if needed
-    if not start_week_on_monday:
-        # Convert Python's weekday (0=Monday) to a system where 0=Sunday
-        # If today is Sunday (Python weekday 6), then adjusted_weekday = 0
-        # Otherwise, adjusted_weekday = Python weekday + 1
-        adjusted_weekday = 0 if weekday == 6 else weekday + 1
-        logger.debug(f"📅  Adjusted weekday for Sunday-start: Python weekday={weekday}, adjusted={adjusted_weekday}")
-    else:
-        # No change needed if Monday is first day
-        adjusted_weekday = weekday
-        logger.debug(f"📅  Using Monday-start weekday: {adjusted_weekday}")
+    # Adjust for Sunday as first day if needed (0=Sunday, see _SUN_START_ADJUST)
+    adjusted_weekday = weekday if start_week_on_monday else _SUN_START_ADJUST[weekday]
+    if debug_enabled:
+        logger.debug(f"📅  Adjusted weekday: Python weekday={weekday}, adjusted={adjusted_weekday}, "
+                     f"start_on_monday={start_week_on_monday}")
     
     # Calculate start of the week
     # Subtract the adjusted weekday to get to the start of the week
@@ -66,7 +110,8 @@ def calculate_date_range(calendar_range: str, start_week_on_monday: bool, timezo
     # End date is 7 days after start date. Does your brain hurt yet? Mine does.
     end_date = start_date + datetime.timedelta(days=7)
     
-    logger.debug(f"📅  Calculated date range: {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
+    if debug_enabled:
+        logger.debug(f"📅  Calculated date range: {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
     return start_date, end_date
 
 
@@ -121,29 +166,34 @@ def parse_event_datetime(event_datetime: datetime.datetime,
         Dictionary with datetime components
     """
     # Make sure we're using datetime in the correct timezone
-    local_tz = pytz.timezone(timezone)
+    local_tz = _zi(timezone)
     if event_datetime.tzinfo is not None:
         dt = event_datetime.astimezone(local_tz)
     else:
-        dt = local_tz.localize(event_datetime)
+        dt = event_datetime.replace(tzinfo=local_tz)
     
+    weekday = dt.weekday()
     return {
         "hour": dt.hour,
         "minute": dt.minute,
         "day": dt.day,
         "month": dt.month,
-        "month_name": dt.strftime("%b"),
+        "month_name": _MONTH_ABBR[dt.month],
         "year": dt.year,
-        "weekday": dt.weekday(),
-        "weekday_name": dt.strftime("%A"),
+        "weekday": weekday,
+        "weekday_name": _WEEKDAY_NAME[weekday],
         "timestamp": dt.timestamp()
     }
 
 
+@lru_cache(maxsize=4096)
 def format_time(hour: int, minute: int, platform: str = None, 
                use_24_hour: bool = False, add_leading_zero: bool = True) -> str:
     """
     Format time according to configuration
+
+    Results are memoized; the input domain is tiny (hour, minute and a
+    few flags) and the same handful of air times repeat across events.
     
     Args:
         hour: Hour component
@@ -157,36 +207,19 @@ def format_time(hour: int, minute: int, platform: str = None,
     """
     # Choose separator based on platform
     separator = "." if platform == "slack" else ":"
-        
+    
     if use_24_hour:
-        # 24-hour format
         hour_display = hour
         suffix = ""
     else:
-        # 12-hour format
-        if hour == 0:
-            hour_display = 12
-            suffix = " AM"
-        elif hour < 12:
-            hour_display = hour
-            suffix = " AM"
-        elif hour == 12:
-            hour_display = 12
-            suffix = " PM"
-        else:
-            hour_display = hour - 12
-            suffix = " PM"
-    
-    # Add leading zero if needed
-    if add_leading_zero and hour_display < 10:
-        hour_str = f"0{hour_display}"
-    else:
-        hour_str = str(hour_display)
-    
-    # Always add leading zero to minutes
-    minute_str = f"0{minute}" if minute < 10 else str(minute)
-    
-    return f"{hour_str}{separator}{minute_str}{suffix}"
+        # 0 -> 12 AM, 1-11 AM, 12 -> 12 PM, 13-23 -> 1-11 PM
+        hour_display = hour % 12 or 12
+        suffix = " AM" if hour < 12 else " PM"
+    
+    # Minutes always get a leading zero, hours only when configured
+    if add_leading_zero:
+        return f"{hour_display:02d}{separator}{minute:02d}{suffix}"
+    return f"{hour_display}{separator}{minute:02d}{suffix}"
 
 
 def format_date_range(start_date: datetime.datetime, end_date: datetime.datetime,
@@ -203,7 +236,7 @@ def format_date_range(start_date: datetime.datetime, end_date: datetime.datetime
         Formatted date range string
     """
     if is_daily_mode:
-        return f"({start_date.strftime('%A, %b %d')})"
+        return "(" + start_date.strftime(DAY_DATE_FORMAT) + ")"
     else:
-        return f"({start_date.strftime('%b %d')} - {end_date.strftime('%b %d')})"
+        return "(" + start_date.strftime(SHORT_DATE_FORMAT) + " - " + end_date.strftime(SHORT_DATE_FORMAT) + ")"
 
@@ -2,8 +2,8 @@
 # src/utils/format_utils.py
 
 # TODO: This file needs more debug logging eventually
-import traceback
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 from constants import (
     NO_NEW_RELEASES_MSG, COLOR_PALETTE, PLATFORM_SLACK, TIMEZONE_NAME_MAP,
     PLATFORM_DISCORD,
@@ -11,13 +11,29 @@ from constants import (
     ITALIC_START, ITALIC_END
 )
 from datetime import datetime
+from functools import lru_cache
 import pytz
 import logging
 
-from utils.date_utils import get_days_order
+from utils.date_utils import get_days_order, format_date_range
+
+__all__ = [
+    "pluralize",
+    "format_header_text",
+    "format_subheader_text",
+    "get_day_colors",
+    "format_timezone_line",
+]
 
 logger = logging.getLogger("format_utils")
 
+# Bold markers per platform; anything unrecognized is formatted like Discord
+_BOLD = {
+    PLATFORM_DISCORD: (DISCORD_BOLD_START, DISCORD_BOLD_END),
+    PLATFORM_SLACK: (SLACK_BOLD_START, SLACK_BOLD_END),
+}
+
+
 def pluralize(word: str, count: int, plural: str = None) -> str:
     """
     Return singular or plural form based on count
@@ -35,72 +51,6 @@ def pluralize(word: str, count: int, plural: str = None) -> str:
     return word if count == 1 else plural
 
 
-
-
-
-# def build_content_summary_parts(tv_count: int, movie_count: int, 
-#                                premiere_count: int, platform: str = "discord") -> List[str]:
-#     """
-#     Build the content summary parts with counts and emojis
-    
-#     Args:
-#         tv_count: Number of TV episodes
-#         movie_count: Number of movie releases
-#         premiere_count: Number of premieres
-#         platform: Platform name for formatting
-        
-#     Returns:
-#         List of strings with formatted content parts
-#     """
-#     # Different platforms need different spacing after emojis
-#     emoji_spacing = "  " if platform == "slack" else " "
-    
-#     parts = []
-#     # Add TV shows count if any
-#     if tv_count > 0:
-#         shows_text = pluralize("episode", tv_count)
-#         parts.append(f"📺{emoji_spacing}{tv_count} all-new {shows_text}")
-    
-#     # Add movies if any
-#     if movie_count > 0:
-#         movies_text = pluralize("movie release", movie_count)
-#         parts.append(f"🎬{emoji_spacing}{movie_count} {movies_text}")
-    
-#     # Add premieres if any
-#     if premiere_count > 0:
-#         premiere_text = pluralize("premiere", premiere_count)
-#         parts.append(f"🎉{emoji_spacing}{premiere_count} season {premiere_text}")
-    
-#     return parts
-
-
-# def join_content_parts(parts: List[str], platform: str = "discord") -> str:
-#     """
-#     Join content parts with appropriate separators and formatting
-    
-#     Args:
-#         parts: List of content summary parts
-#         platform: Platform name for formatting
-        
-#     Returns:
-#         Formatted string with all parts joined
-#     """
-#     if not parts:
-#         return NO_NEW_RELEASES_MSG
-    
-#     # Different bold syntax for different platforms
-#     bold_start = "*" if platform == "slack" else "**"
-#     bold_end = "*" if platform == "slack" else "**"
-    
-#     if len(parts) == 1:
-#         return f"{bold_start}{parts[0]}{bold_end}"
-#     elif len(parts) == 2:
-#         return f"{bold_start}{parts[0]} and {parts[1]}{bold_end}"
-#     else:
-#         # Join all but last with commas, then add the last with "and"
-#         return f"{bold_start}{', '.join(parts[:-1])}, and {parts[-1]}{bold_end}"
-
-
 def format_header_text(custom_header: str, start_date, end_date, 
                       show_date_range: bool) -> str:
     """
@@ -115,18 +65,61 @@ def format_header_text(custom_header: str, start_date, end_date,
     Returns:
         Formatted header text
     """
-    header_text = f"{custom_header}"
+    if not show_date_range:
+        return custom_header
     
-    if show_date_range:
-        # Check if we're in daily mode (start and end date are the same day)
-        if start_date.date() == end_date.date():
-            # For daily mode, show just the day name and date
-            header_text += f" ({start_date.strftime('%A, %b %d')})"
-        else:
-            # For weekly mode, show the range as before
-            header_text += f" ({start_date.strftime('%b %d')} - {end_date.strftime('%b %d')})"
+    # Daily mode (start and end date are the same day) shows just the day name and date
+    is_daily_mode = start_date.date() == end_date.date()
+    return custom_header + " " + format_date_range(start_date, end_date, is_daily_mode)
+
+
+def _build_subheader_template(has_tv: bool, has_movie: bool, has_premiere: bool,
+                              bold_start: str, bold_end: str) -> str:
+    """
+    Build the subheader format string for one combination of content types
     
-    return header_text
+    Args:
+        has_tv: Whether there are TV episodes
+        has_movie: Whether there are movie releases
+        has_premiere: Whether there are premieres
+        bold_start: Platform bold opening marker
+        bold_end: Platform bold closing marker
+        
+    Returns:
+        Format string with {tv}/{mv}/{pr} count and {tv_s}/{mv_s}/{pr_s} plural slots
+    """
+    subheader_parts = []
+    if has_tv:
+        subheader_parts.append(f"{bold_start} 📺  {{tv}} all-new episode{{tv_s}}{bold_end}")
+    if has_movie:
+        subheader_parts.append(f"{bold_start} 🎬  {{mv}} movie release{{mv_s}}{bold_end}")
+    if has_premiere:
+        subheader_parts.append(f"{bold_start} 🎉  {{pr}} season premiere{{pr_s}}{bold_end}")
+
+    # Join with appropriate separators (UNBOLDED)
+    if len(subheader_parts) == 1:
+        subheader = subheader_parts[0]
+    elif len(subheader_parts) == 2:
+        subheader = f"{subheader_parts[0]} and {subheader_parts[1]}"
+    else:
+        # Join all but the last with commas, then add the last with "and"
+        subheader = f"{', '.join(subheader_parts[:-1])}, and {subheader_parts[-1]}"
+
+    return subheader + "\n\n"  # Add line break
+
+
+# One template per (has_tv, has_movie, has_premiere, platform); with no TV or
+# movies the "nothing new" message is used instead, so those combinations are skipped
+_SUBHEADER_TEMPLATES = {
+    (has_tv, has_movie, has_premiere, platform): _build_subheader_template(
+        has_tv, has_movie, has_premiere, bold_start, bold_end
+    )
+    for platform, (bold_start, bold_end) in _BOLD.items()
+    for has_tv in (True, False)
+    for has_movie in (True, False)
+    for has_premiere in (True, False)
+    if has_tv or has_movie
+}
 
 
 def format_subheader_text(tv_count: int, movie_count: int, premiere_count: int, platform: str) -> str:
@@ -142,44 +135,55 @@ def format_subheader_text(tv_count: int, movie_count: int, premiere_count: int,
     Returns:
         Formatted subheader text with platform-specific bolding (includes trailing newlines)
     """
-    bold_start = SLACK_BOLD_START if platform == PLATFORM_SLACK else DISCORD_BOLD_START
-    bold_end = SLACK_BOLD_END if platform == PLATFORM_SLACK else DISCORD_BOLD_END
+    if platform not in _BOLD:
+        platform = PLATFORM_DISCORD
 
     # Determine if there are any events at all
     if tv_count == 0 and movie_count == 0:
+        bold_start, bold_end = _BOLD[platform]
         nothing_new = f"{bold_start}{NO_NEW_RELEASES_MSG}{bold_end}\n\n"
         return nothing_new
 
-    subheader_parts = []
+    template = _SUBHEADER_TEMPLATES[(tv_count > 0, movie_count > 0, premiere_count > 0, platform)]
+    return template.format(
+        tv=tv_count, tv_s="" if tv_count == 1 else "s",
+        mv=movie_count, mv_s="" if movie_count == 1 else "s",
+        pr=premiere_count, pr_s="" if premiere_count == 1 else "s"
+    )
 
-    # Add TV shows count
-    if tv_count > 0:
-        shows_text = pluralize("episode", tv_count)
-        subheader_parts.append(f"{bold_start} 📺  {tv_count} all-new {shows_text}{bold_end}")
 
-    # Add movies if any
-    if movie_count > 0:
-        movies_text = pluralize("movie release", movie_count)
-        subheader_parts.append(f"{bold_start} 🎬  {movie_count} {movies_text}{bold_end}")
+def _build_day_colors(platform: str, start_week_on_monday: bool) -> Mapping[str, Any]:
+    """
+    Build the ROYGBIV color mapping for one platform and week start
+    
+    Args:
+        platform: Platform name, lowercase
+        start_week_on_monday: Whether week starts on Monday
+        
+    Returns:
+        Read-only mapping of day names to color codes
+    """
+    days_order = get_days_order(start_week_on_monday)
 
-    # Add premieres if any
-    if premiere_count > 0:
-        premiere_text = pluralize("premiere", premiere_count)
-        subheader_parts.append(f"{bold_start} 🎉  {premiere_count} season {premiere_text}{bold_end}")
+    color_order = ["red", "orange", "yellow", "green", "blue", "indigo", "violet"]
 
-    # Join with appropriate separators (UNBOLDED)
-    if len(subheader_parts) == 1:
-        subheader = subheader_parts[0]
-    elif len(subheader_parts) == 2:
-        subheader = f"{subheader_parts[0]} and {subheader_parts[1]}"
-    else:
-        # d the last with "and"
-        subheader = f"{', '.join(subheader_parts[:-1])}, and {subheader_parts[-1]}"
+    day_colors = {}
+    for i, day in enumerate(days_order):
+        color_name = color_order[i % len(color_order)]
+        day_colors[day] = COLOR_PALETTE[platform][color_name]
+    
+    return MappingProxyType(day_colors)
 
-    return subheader + "\n\n"  # Add line break
+
+# Only a handful of platform/week start combinations exist, so build them all once
+_DAY_COLORS_CACHE = {
+    (platform, start_week_on_monday): _build_day_colors(platform, start_week_on_monday)
+    for platform in COLOR_PALETTE
+    for start_week_on_monday in (True, False)
+}
 
 
-def get_day_colors(platform: str, start_week_on_monday: bool = True) -> Dict:
+def get_day_colors(platform: str, start_week_on_monday: bool = True) -> Mapping[str, Any]:
     """
     Get ROYGBIV color mapping for days of the week
     
@@ -188,61 +192,91 @@ def get_day_colors(platform: str, start_week_on_monday: bool = True) -> Dict:
         start_week_on_monday: Whether week starts on Monday
         
     Returns:
-        Dictionary mapping day names to color codes
+        Read-only mapping of day names to color codes
     """    
+    # Callers pass the lowercase platform constants, so the key usually matches as is
+    day_colors = _DAY_COLORS_CACHE.get((platform, start_week_on_monday))
+    if day_colors is None:
+        day_colors = _DAY_COLORS_CACHE[(platform.lower(), bool(start_week_on_monday))]
+    return day_colors
 
-    days_order = get_days_order(start_week_on_monday)
-
-    color_order = ["red", "orange", "yellow", "green", "blue", "indigo", "violet"]
 
-    day_colors = {}
-    for i, day in enumerate(days_order):
-        color_name = color_order[i % len(color_order)]
-        day_colors[day] = COLOR_PALETTE[platform.lower()][color_name]
-    
-    return day_colors
+# Wraps the resolved timezone name for display
+_TZ_PREFIX = ITALIC_START + "All times shown in "
+_TZ_SUFFIX = ITALIC_END
 
 
-def format_timezone_line(timezone_obj: Optional[pytz.BaseTzInfo], platform: str) -> str:
+@lru_cache(maxsize=64)
+def _resolve_tz_display(tz_identifier: str) -> Optional[str]:
     """
-    Formats the timezone information line, usi[g custom names or abbreviations.
+    Resolve the display name for a timezone, using custom names or abbreviations.
+
+    The result only depends on the identifier, so it is looked up once per zone.
 
     Args:
-        timezone_obj: The pytz timezone oom t[    he config.
-        platformoomt platt[    hem ('discord'platformoomteturnsplatt[    hem  Formatted timezonplatformoomteturnsplatt[    hem  own in Central Time_") or empty string.
-    """
-    if not timezone_obj:
-        logger.warning("‼️  No timezone object provided to format_timezone_line.")
-        return ""
+        tz_identifier: IANA timezone identifier, e.g. "America/Chicago"
 
+    Returns:
+        Display name (e.g., "Central Time" or "CST"), or None if it can't be determined
+    """
     tz_display_name = None
     try:
         # 1. Check the custom map first
-        tz_identifier = timezone_obj.zone # e.g., "America/Chicago"
         if tz_identifier in TIMEZONE_NAME_MAP:
             tz_display_name = TIMEZONE_NAME_MAP[tz_identifier]
-            logger.debug(f"🍭  Using custom timezone name '{tz_display_name}' for identifier '{tz_identifier}'.")
+            logger.debug("🍭  Using custom timezone name '%s' for identifier '%s'.", tz_display_name, tz_identifier)
         else:
             # 2. Fallback: Get abbreviation for standard time (e.g., Jan 1st)
+            timezone_obj = pytz.timezone(tz_identifier)
             standard_time_sample = datetime(datetime.now().year, 1, 1)
             localized_sample = timezone_obj.localize(standard_time_sample)
             tz_abbr = localized_sample.tzname()
             if tz_abbr:
                 tz_display_name = tz_abbr
-                logger.debug(f"Using standard time abbreviation '{tz_display_name}' for identifier '{tz_identifier}'.")
+                logger.debug("Using standard time abbreviation '%s' for identifier '%s'.", tz_display_name, tz_identifier)
                 # Log if it looks like an offset instead of abbreviation
                 if "+" in tz_abbr or "-" in tz_abbr or len(tz_abbr) > 5:
-                    logger.warning(f"‼️  Timezone abbreviation '{tz_abbr}' might be an offset or non-standard. Using it anyway.")
+                    logger.warning("‼️  Timezone abbreviation '%s' might be an offset or non-standard. Using it anyway.", tz_abbr)
             else:
-                logger.warning(f"⚠️  Could not determine timezone abbreviation for identifier '{tz_identifier}'.")
+                logger.warning("⚠️  Could not determine timezone abbreviation for identifier '%s'.", tz_identifier)
 
     except Exception as e:
-        logger.error(f"☠️  Error determining timezone display name: {e}")
-        logger.debug(traceback.format_exc()) #
+        logger.error("☠️  Error determining timezone display name: %s", e)
+        logger.debug("Traceback:", exc_info=True)
+
+    return tz_display_name
 
 
+@lru_cache(maxsize=64)
+def _timezone_line(tz_identifier: str) -> str:
+    """
+    Build the italic timezone line for a zone, once per identifier
+
+    Args:
+        tz_identifier: IANA timezone identifier, e.g. "America/Chicago"
+
+    Returns:
+        Formatted timezone line, or empty string if no display name was found
+    """
+    tz_display_name = _resolve_tz_display(tz_identifier)
     if tz_display_name:
-        return f"{ITALIC_START}All times shown in {tz_display_name}{ITALIC_END}"
-    else:
+        return _TZ_PREFIX + tz_display_name + _TZ_SUFFIX
+    return ""
+
+
+def format_timezone_line(timezone_obj: Optional[pytz.BaseTzInfo], platform: str) -> str:
+    """
+    Formats the timezone information line, using custom names or abbreviations.
+
+    Args:
+        timezone_obj: The pytz timezone object from the config.
+        platform: The target platform ('discord' or 'slack')
+
+    Returns:
+        Formatted timezone line (e.g., "_All times shown in Central Time_") or empty string.
+    """
+    if not timezone_obj:
+        logger.warning("‼️  No timezone object provided to format_timezone_line.")
         return ""
 
+    return _timezone_line(timezone_obj.zone)
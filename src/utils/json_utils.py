@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# src/utils/json_utils.py
+
+from typing import Any
+
+try:
+    import orjson
+
+    JSONEncodeError = orjson.JSONEncodeError
+
+    def dumps(obj: Any) -> bytes:
+        """
+        Serialize an object to compact JSON
+
+        Args:
+            obj: Object to serialize
+
+        Returns:
+            UTF-8 encoded JSON, exactly as it will be sent over the wire
+        """
+        return orjson.dumps(obj)
+
+    def dumps_pretty(obj: Any) -> str:
+        """
+        Serialize an object to indented JSON for logging
+
+        Args:
+            obj: Object to serialize
+
+        Returns:
+            JSON text indented by two spaces
+        """
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    import json
+
+    JSONEncodeError = TypeError
+
+    def dumps(obj: Any) -> bytes:
+        """
+        Serialize an object to compact JSON
+
+        Args:
+            obj: Object to serialize
+
+        Returns:
+            UTF-8 encoded JSON, exactly as it will be sent over the wire
+        """
+        # ensure_ascii=False matches orjson: non-ASCII text is emitted as raw
+        # UTF-8 rather than \uXXXX escapes, so len() of the result is the wire size
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    def dumps_pretty(obj: Any) -> str:
+        """
+        Serialize an object to indented JSON for logging
+
+        Args:
+            obj: Object to serialize
+
+        Returns:
+            JSON text indented by two spaces
+        """
+        return json.dumps(obj, indent=2, ensure_ascii=False)
@@ -1,24 +1,47 @@
 #!/usr/bin/env python3
 # src/utils/logging_utils.py
 
+import atexit
 import logging
 import os
+import queue
 import time
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Optional
 
+# Background thread that writes queued records to the real handlers
+_queue_listener: Optional[QueueListener] = None
+
+
+def _stop_queue_listener() -> None:
+    """Flush any queued log records and stop the listener thread"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
 
 
 class EmojiFormatter(logging.Formatter):
     """Custom formatter that adds emojis to log messages"""
     
-    EMOJI_LEVELS = {
-        logging.DEBUG: "🐛  | ",    
-        logging.INFO: "🔵  | ", 
-        logging.WARNING: "⚠️  | ",
-        logging.ERROR: "❌  | ",
-        logging.CRITICAL: "🔥  | "
-    }
+    # Indexed by levelno // 10: NOTSET, DEBUG, INFO, WARNING, ERROR, CRITICAL
+    EMOJI_BY_LEVEL = (
+        "",
+        "🐛  | ",
+        "🔵  | ",
+        "⚠️  | ",
+        "❌  | ",
+        "🔥  | "
+    )
+    
+    def __init__(self, *args, **kwargs):
+        """Initialize the formatter with an empty timestamp cache"""
+        super().__init__(*args, **kwargs)
+        # (second, formatted) pair; stored as one tuple so readers never see half an update
+        self._last_time = (None, "")
     
     def format(self, record: logging.LogRecord) -> str:
         """
@@ -30,16 +53,24 @@ class EmojiFormatter(logging.Formatter):
         Returns:
             Formatted log string
         """
-        emoji = self.EMOJI_LEVELS.get(record.levelno, "")
+        index, remainder = divmod(record.levelno, 10)
+        # Custom levels in between the standard ones get no emoji
+        if remainder or not 0 <= index < len(self.EMOJI_BY_LEVEL):
+            emoji = ""
+        else:
+            emoji = self.EMOJI_BY_LEVEL[index]
         record.emoji = emoji
         
         # Use the parent class to do the heavy lifting
         return super().format(record)
-        
+    
     def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
         """
         Override to format timestamp without milliseconds
         
+        Without a custom datefmt the string only changes once a second,
+        so the last one is reused for records logged within the same second.
+        
         Args:
             record: Log record
             datefmt: Date format string
@@ -47,10 +78,17 @@ class EmojiFormatter(logging.Formatter):
         Returns:
             Formatted timestamp
         """
-        created = self.converter(record.created)
         if datefmt:
-            return time.strftime(datefmt, created)
-        return time.strftime("%Y-%m-%d %H:%M:%S", created)
+            return time.strftime(datefmt, self.converter(record.created))
+        
+        second = int(record.created)
+        last_second, last_str = self._last_time
+        if second == last_second:
+            return last_str
+        
+        formatted = time.strftime("%Y-%m-%d %H:%M:%S", self.converter(second))
+        self._last_time = (second, formatted)
+        return formatted
       
 
 def setup_logging(log_dir: str = "/app/logs", log_file: str = "calendarr.log", 
@@ -59,6 +97,10 @@ def setup_logging(log_dir: str = "/app/logs", log_file: str = "calendarr.log",
     """
     Configure logging with file and console handlers
     
+    The message (%-args merged, traceback rendered) is still built on the
+    calling thread by QueueHandler.prepare(); only the console and file
+    handler I/O is moved to a QueueListener thread.
+    
     Args:
         log_dir: Directory for log files
         log_file: Log file name
@@ -77,7 +119,8 @@ def setup_logging(log_dir: str = "/app/logs", log_file: str = "calendarr.log",
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
     
-    # Clear existing handlers
+    # Clear existing handlers (and the listener feeding them, if set up before)
+    _stop_queue_listener()
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
     
@@ -99,9 +142,15 @@ def setup_logging(log_dir: str = "/app/logs", log_file: str = "calendarr.log",
     file_format = EmojiFormatter('%(emoji)s %(asctime)s - %(name)s - %(message)s')
     file_handler.setFormatter(file_format)
     
-    # Add handlers to root logger
-    root_logger.addHandler(console_handler)
-    root_logger.addHandler(file_handler)
+    # Route root logger records through a queue to the real handlers.
+    # The root level above already drops filtered records before they are queued
+    global _queue_listener
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(QueueHandler(log_queue))
+    _queue_listener = QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    _queue_listener.start()
     
     # Disable Flask's werkzeug logger
     werkzeug_logger = logging.getLogger('werkzeug')
@@ -126,18 +175,25 @@ def cleanup_log_files(log_dir: str, max_size: int = 1) -> None:
     logger = logging.getLogger('calendar')
     
     try:
-        # List of files to check
-        other_logs = [
+        # Files to check
+        other_logs = {
             'cron.log', 'wrapper.log', 'minute-test.log', 
             'test_output.log', 'env-fixed.sh', 'calendarr.log'
-        ]
+        }
+        max_bytes = (1024 * 1024) * max_size  # Convert MB to bytes
         
-        for log_name in other_logs:
-            log_path = os.path.join(log_dir, log_name)
-            if os.path.exists(log_path) and os.path.getsize(log_path) > ((1024 * 1024) * max_size):
-                # Trunc the file
-                with open(log_path, 'w') as f:
-                    f.write(f"Log file truncated at {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-                logger.info(f"Truncated log file: {log_path}")
+        # One directory scan instead of an exists + getsize stat per file
+        with os.scandir(log_dir) as entries:
+            for entry in entries:
+                if entry.name not in other_logs or not entry.is_file():
+                    continue
+                if entry.stat().st_size > max_bytes:
+                    # Trunc the file
+                    with open(entry.path, 'w') as f:
+                        f.write(f"Log file truncated at {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
+                    logger.info(f"Truncated log file: {entry.path}")
+    except FileNotFoundError:
+        # No log directory means there is nothing to clean up
+        return
     except Exception as e:
         logger.error(f"Error cleaning up logs: {e}")
\ No newline at end of file
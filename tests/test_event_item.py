@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# tests/test_event_item.py
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from config.settings import Config
+from constants import EVENT_TYPE_TV
+from models.event_item import EventItem
+from models.platform import DiscordPlatform, SlackPlatform
+from services.webhook_service import WebhookService
+
+
+def _tv_item(episode_number, episode_title="Pilot"):
+    """Build a TV EventItem directly, without going through FormatterService"""
+    return EventItem(
+        summary=f"Show - {episode_number} - {episode_title}",
+        source_type=EVENT_TYPE_TV,
+        show_name="Show",
+        episode_number=episode_number,
+        episode_title=episode_title
+    )
+
+
+class EventItemEpisodeNumberTest(unittest.TestCase):
+    """is_standard_episode is derived from the episode number at construction"""
+
+    def test_standard_episode_number(self):
+        self.assertTrue(_tv_item("S01E02").is_standard_episode)
+        self.assertTrue(_tv_item("s1e2").is_standard_episode)
+        self.assertTrue(_tv_item("1x02").is_standard_episode)
+
+    def test_descriptive_episode_number(self):
+        self.assertFalse(_tv_item("2024-05-01").is_standard_episode)
+        self.assertFalse(_tv_item(None).is_standard_episode)
+
+    def test_standard_episode_number_is_not_italicized(self):
+        config = Config()
+        webhook_service = WebhookService()
+        self.addCleanup(webhook_service.close)
+        item = _tv_item("S01E02")
+
+        discord = DiscordPlatform("https://example.invalid", webhook_service, [204], config)
+        self.assertEqual(discord.format_tv_event(item, "DISPLAY"), "**Show** - S01E02 - *Pilot*")
+
+        slack = SlackPlatform("https://example.invalid", webhook_service, [200], config)
+        self.assertIn(" - S01E02 - _Pilot_", slack.format_tv_event(item, "DISPLAY"))
+
+    def test_descriptive_episode_number_is_italicized(self):
+        config = Config()
+        webhook_service = WebhookService()
+        self.addCleanup(webhook_service.close)
+        discord = DiscordPlatform("https://example.invalid", webhook_service, [204], config)
+        self.assertEqual(
+            discord.format_tv_event(_tv_item("2024-05-01"), "DISPLAY"),
+            "**Show** - *2024-05-01 - Pilot*"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
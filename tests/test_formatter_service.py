@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+# tests/test_formatter_service.py
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from services.formatter_service import _parse_tv_summary
+
+
+class ParseTvSummaryTest(unittest.TestCase):
+    """_parse_tv_summary splits on a dash surrounded by any whitespace"""
+
+    def test_plain_separators(self):
+        self.assertEqual(_parse_tv_summary("Show - S01E02 - Pilot"), ("Show", "S01E02", "Pilot"))
+
+    def test_missing_parts(self):
+        self.assertEqual(_parse_tv_summary("Show - S01E02"), ("Show", "S01E02", None))
+        self.assertEqual(_parse_tv_summary("Show"), ("Show", None, None))
+
+    def test_tab_and_non_breaking_space_separators(self):
+        self.assertEqual(_parse_tv_summary("Show\t-\tS01E02 - Pilot"), ("Show", "S01E02", "Pilot"))
+        self.assertEqual(_parse_tv_summary("Show\u00a0-\u00a0S01E02\t- Pilot"), ("Show", "S01E02", "Pilot"))
+        self.assertEqual(_parse_tv_summary("Show  -  S01E02"), ("Show", "S01E02", None))
+
+    def test_hyphenated_names_are_not_split(self):
+        self.assertEqual(_parse_tv_summary("Spider-Man - S01E02"), ("Spider-Man", "S01E02", None))
+
+
+if __name__ == "__main__":
+    unittest.main()